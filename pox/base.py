@@ -1,9 +1,10 @@
 import argparse
+import functools
 import sys
-from enum import Enum
 
 from .utils import box_message
 from .warnings import ConversionError as E
+from .warnings import ConversionErrorDescription as D
 
 # Width of the help description
 ARGPARSE_TERMINAL_WIDTH = 78
@@ -12,6 +13,15 @@ ARGPARSE_TERMINAL_WIDTH = 78
 ARGPARSE_HELP_POSITION = 5
 
 
+@functools.cache
+def boxed_description(description: D) -> str:
+    """
+    The boxed text of an issue description. There is only a fixed set of them,
+    so each is boxed once.
+    """
+    return box_message(description)
+
+
 class ArgumentFormatter(
     argparse.RawTextHelpFormatter,
 ):
@@ -24,25 +34,31 @@ class ArgumentFormatter(
 class BaseConverter:
     def fail(self, message: str | E, icon: str | None = "❌️") -> None:
         icon = f"{icon} " if icon else ""
-        message = message.value if isinstance(message, Enum) else message
         sys.stderr.write(f"{icon}{message}\n")
-        sys.stderr.flush()
+        self.flush()
         sys.exit(1)
 
     def warning(self, message: str | E, icon: str | None = "⚠️") -> None:
         icon = f"{icon} " if icon else ""
-        message = message.value if isinstance(message, Enum) else message
         sys.stderr.write(f"{icon}{message}\n")
-        sys.stderr.flush()
 
     def ok(self, message: str | E, icon: str | None = "✅") -> None:
         icon = f"{icon} " if icon else ""
-        message = message.value if isinstance(message, Enum) else message
         sys.stdout.write(f"{icon}{message}\n")
-        sys.stdout.flush()
 
-    def display_messages(self, messages: list[E]) -> None:
-        issues = "\n\n".join([box_message(w.value) for w in set(messages)])
+    def display_messages(self, messages: list[D]) -> None:
+        # The box is only decoration for the terminal, redirected output
+        # (logs, CI) gets the plain descriptions.
+        box = boxed_description if sys.stderr.isatty() else str
+        issues = "\n\n".join(box(w) for w in dict.fromkeys(messages))
         sys.stderr.write(
             f"\n⚠️ There have been issues during the conversion:\n\n{issues}\n",
         )
+
+    def flush(self) -> None:
+        """
+        Flush the buffered output streams. Messages are written without an
+        explicit flush, so call this at the end of a run.
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
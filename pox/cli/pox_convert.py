@@ -2,13 +2,14 @@
 Convert PO to Excel files
 """
 import argparse
-import asyncio
 import glob
+import operator
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
-
-import polib
+from typing import TYPE_CHECKING
 
 from ..base import ArgumentFormatter, BaseConverter
 from ..datastructures import (
@@ -18,16 +19,63 @@ from ..datastructures import (
     SpreadsheetContext,
 )
 from ..plurals import get_plural_hints
-from ..spreadsheet import SpreadsheetGenerator
 from ..utils import dedent
 from ..warnings import ConversionError as E
 from ..warnings import ConversionErrorDescription as D
 
+if TYPE_CHECKING:
+    import polib
+
+# Maximum number of po files converted in parallel.
+MAX_WORKERS = 32
+
+# Fetches all po entry attributes a Message is built from in a single call.
+get_entry_fields = operator.attrgetter(
+    "msgid",
+    "msgstr",
+    "msgid_plural",
+    "msgstr_plural",
+    "msgctxt",
+    "comment",
+    "tcomment",
+    "obsolete",
+)
+
+
+def entry_to_message(item: "polib.POEntry") -> Message:
+    """
+    Convert a polib entry to a Message.
+    """
+    (
+        msgid,
+        msgstr,
+        msgid_plural,
+        msgstr_plural,
+        msgctxt,
+        comment,
+        tcomment,
+        obsolete,
+    ) = get_entry_fields(item)
+
+    # This item has multiple pluralization forms
+    if msgstr_plural:
+        t = PluralTranslation(msgid=msgid_plural, msgstr=msgstr_plural)
+    else:
+        t = SingularTranslation(msgid=msgid, msgstr=msgstr)
+
+    return Message(
+        translation=t,
+        context=msgctxt,
+        comment=comment,
+        tcomment=tcomment,
+        obsolete=bool(obsolete),
+    )
+
 
 class Po2ExcelConverter(BaseConverter):
     options: argparse.Namespace
-    po_files: list[Path] = []
-    warning_descriptions: list[D] = []
+    po_files: set[Path]
+    warning_descriptions: list[D]
 
     def __init__(self, options: argparse.Namespace):
         """
@@ -36,91 +84,128 @@ class Po2ExcelConverter(BaseConverter):
         here.
         """
         self.options = options
+        self.po_files = set()
+        self.warning_descriptions = []
 
         # Make sure, the output directory exists and is a directory
         if options.outdir and (not options.outdir.is_dir()):
-            self.fail(E.OUTPUT_DIR_DOES_NOT_EXIST.value.format(outdir=options.outdir))
+            self.fail(E.OUTPUT_DIR_DOES_NOT_EXIST.format(outdir=options.outdir))
+
+        # Check the filename format once, so an invalid format fails right
+        # away and not for every po file after it was parsed.
+        try:
+            options.filename.format(lang="", date="")
+        except (KeyError, IndexError, ValueError):
+            self.fail(E.INVALID_FILENAME_FORMAT.format(filename=options.filename))
 
         # Glob and gather all given po files and check for their existence.
+        # Overlapping globs may match a file twice, the set keeps it once.
         for po_glob in options.po_file:
             for path in glob.glob(po_glob, recursive=True):
                 p = Path(path)
                 if p.is_dir():
-                    self.warning(message=E.FILE_IS_FOLDER.value.format(p=p))
+                    self.warning(message=E.FILE_IS_FOLDER.format(p=p))
                     continue
-                self.po_files.append(p.resolve())
+                self.po_files.add(p.resolve())
 
         # The language can only be used for a single po file, otherwise
         # we'd overwrite them all with the same language.
         if options.language and len(self.po_files) > 1:
             self.fail(E.LANGUAGE_WITH_GLOB)
 
-    async def run(self):
+    def run(self):
         """
         Convert every po file to spreadsheets.
+
+        The files are read and written in a thread pool. The output paths are worked
+        out in between, so two po files never write to the same spreadsheet. All
+        messages are reported in the sorted order of the po files.
         """
-        async with asyncio.TaskGroup() as tg:
-            for path in sorted(self.po_files):
-                tg.create_task(self.convert_po_file(path))
+        # polib and openpyxl are only needed for the actual conversion, importing
+        # them here keeps the startup of `--help` and argument errors fast.
+        import polib  # noqa: F401
+
+        from ..spreadsheet import SpreadsheetGenerator
+
+        po_files = sorted(self.po_files)
+        xlsx = SpreadsheetGenerator(outdir=self.options.outdir)
+        spreadsheets: dict[Path, SpreadsheetContext] = {}
+        sources: dict[Path, Path] = {}
+
+        workers = min(MAX_WORKERS, len(po_files)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.load_po_file, po_files)
+
+            # Po files with the same language would end up in the same spreadsheet,
+            # only the first one is converted.
+            for path, result in zip(po_files, results, strict=True):
+                context, warning, description = result
+                if warning:
+                    self.warning(warning)
+                if description:
+                    self.warning_descriptions.append(description)
+                if context is None:
+                    continue
+                filename = xlsx.get_filename(self.options.filename, context)
+                if filename in spreadsheets:
+                    self.warning(
+                        E.DUPLICATE_OUTPUT.format(
+                            p=path,
+                            other=sources[filename],
+                            filename=filename,
+                        ),
+                    )
+                    continue
+                spreadsheets[filename] = context
+                sources[filename] = path
+
+            # Consume the results, so exceptions of a worker are raised here.
+            generate = partial(xlsx.generate, self.options.filename)
+            list(executor.map(generate, spreadsheets.values()))
+
+        for filename in spreadsheets:
+            self.ok(f"Created {filename}")
 
         if self.warning_descriptions:
             self.display_messages(self.warning_descriptions)
 
-    async def convert_po_file(self, path: Path) -> None:
+        self.flush()
+
+    def load_po_file(
+        self,
+        path: Path,
+    ) -> tuple[SpreadsheetContext | None, str | None, D | None]:
         """
-        Convert the given po file to a spreadsheet.
+        Read the given po file and return the context of its spreadsheet.
 
         This method collects all translation messages from the given po file and
         re-structures them to a "Message" class which is passed to the spreadsheet.
+        If the file can't be converted, there is no context but a warning and
+        possibly an issue description. They are returned instead of reported, so
+        run() reports them in order.
         """
+        # Already imported by run(), this only looks up the module.
+        import polib
+
         try:
             pofile = polib.pofile(str(path))
         except UnicodeDecodeError:
             # Can't read the file, probably a binary and not a .po file.
-            self.warning(E.FILE_UNREADABLE.value.format(p=path))
-            self.warning_descriptions.append(D.DECODE_ERROR)
-            return
+            return None, E.FILE_UNREADABLE.format(p=path), D.DECODE_ERROR
         except Exception:
             # Any other exception with polib.
-            self.warning(E.FILE_UNREADABLE.value.format(p=path))
-            return
+            return None, E.FILE_UNREADABLE.format(p=path), None
 
         # Having a language set is crucial as it determines the filename.
         # If it's not set with --language, it's required to be in the metadata.
         language = self.options.language or pofile.metadata.get("Language")
 
         if not language:
-            self.warning(E.NO_LANGUAGE.value.format(p=path))
-            self.warning_descriptions.append(D.MISSING_LANGUAGE)
-            return
+            return None, E.NO_LANGUAGE.format(p=path), D.MISSING_LANGUAGE
 
         # Restructure all polib entries to a defined Message structure
         # we use to convert to a spreadsheet and back.
-        messages: list[Message] = []
-        item: polib.POEntry
-
-        for item in iter(pofile):
-            # This item has multiple pluralization forms
-            if item.msgstr_plural:
-                t = PluralTranslation(
-                    msgid=item.msgid_plural,
-                    msgstr=item.msgstr_plural,
-                )
-            else:
-                t = SingularTranslation(
-                    msgid=item.msgid,
-                    msgstr=item.msgstr,
-                )
-
-            m = Message(
-                translation=t,
-                context=item.msgctxt,
-                comment=item.comment,
-                tcomment=item.tcomment,
-                obsolete=item.obsolete == 1,
-            )
-
-            messages.append(m)
+        messages: list[Message] = [entry_to_message(item) for item in pofile]
 
         # Build out a context item with all necessary data to create
         # a spreadsheet.
@@ -130,18 +215,13 @@ class Po2ExcelConverter(BaseConverter):
             language=language,
             plural_form_hints=get_plural_hints(pofile.metadata.get("Plural-Forms")),
         )
-
-        # Convert to a spreadsheet.
-        xlsx = SpreadsheetGenerator(outdir=self.options.outdir)
-        filename = xlsx.generate(filename=self.options.filename, context=context)
-
-        self.ok(f"Created {filename}")
+        return context, None, None
 
 
 def main():
     parser = argparse.ArgumentParser(
         prog="pox-convert",
-        formatter_class=lambda prog: ArgumentFormatter(prog),
+        formatter_class=ArgumentFormatter,
         description="""
             Convert .po files to Excel Spreadsheets. Set one or more .po files:
 
@@ -224,7 +304,7 @@ def main():
     options = parser.parse_args()
 
     convert = Po2ExcelConverter(options=options)
-    asyncio.run(convert.run())
+    convert.run()
 
 
 if __name__ == "__main__":
@@ -1,36 +1,40 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from functools import cached_property
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SingularTranslation:
     msgid: str
     msgstr: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PluralTranslation:
     msgid: str
     msgstr: dict[int, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     translation: SingularTranslation | PluralTranslation
     context: str | None
     comment: str | None  # Code comment
     tcomment: str | None  # Translator comment
     obsolete: bool
+    is_plural: bool = field(init=False, compare=False)
 
-    @cached_property
-    def is_plural(self):
-        return isinstance(self.translation, PluralTranslation)
+    def __post_init__(self):
+        # The translation is frozen, so determine its type once.
+        object.__setattr__(
+            self,
+            "is_plural",
+            isinstance(self.translation, PluralTranslation),
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadsheetContext:
     language: str
     messages: list[Message]
     created: datetime
-    plural_form_hints: dict[int, str] | None
+    plural_form_hints: tuple[str, ...]
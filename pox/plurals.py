@@ -11,36 +11,49 @@ would require executing arbitrary code from a po file.
 
 See https://www.gnu.org/software/gettext/manual/html_node/Plural-forms.html
 """
+import functools
 import re
 
+from .utils import remove_control_characters
+
 RE_PLURAL_COUNT = re.compile(r"nplurals=(?P<num>\d+);")
 
+DEFAULT_PLURAL_HINTS = ("Singular", "Plural")
+
 
-def get_plural_hints(plural_form: str | None) -> dict[int, str] | None:
+def get_plural_hints(plural_form: str | None) -> tuple[str, ...]:
     """
-    Try to get the po file's plural form mapping from above dictionary.
+    Return the hints of the po file's plural forms, as a tuple indexed by plural
+    form, e.g. `("Singular", "Plural")`.
 
-    Remove all whitespace and linebreaks from the key's as well as the given
-    po form string, to avoid match errors due to those minor differences.
+    All whitespace and linebreaks are removed from the given plural form first,
+    so minor differences in the header hit the same cached result.
     """
-    default_form = {
-        0: "Singular",
-        1: "Plural",
-    }
+    if plural_form:
+        plural_form = remove_control_characters(plural_form)
+    return _get_plural_hints(plural_form)
+
 
+@functools.lru_cache(maxsize=128)
+def _get_plural_hints(plural_form: str | None) -> tuple[str, ...]:
+    """
+    Most po files of a project share the same plural form, so the result is
+    cached per normalized form. It's an immutable tuple of the hints, indexed by
+    plural form, since it's shared between all callers.
+    """
     # Pofile contains no plural form, assume that we have a
     # simple Singular/Plural variant.
     if not plural_form:
-        return default_form
+        return DEFAULT_PLURAL_HINTS
 
     match = RE_PLURAL_COUNT.search(plural_form)
 
     # There is a plural form set, but it does not say the actual count of
     # forms. Probably broken.
     if not match:
-        return default_form
+        return DEFAULT_PLURAL_HINTS
 
     # For now, generate a list of Plural forms.
     # @TODO: Generate a better list in the format "n = 0, 1, 2 ..."
-    num = int(match.groupdict()["num"])
-    return {i: f"Plural Form {i+1}" for i in range(num)}
+    num = int(match.group("num"))
+    return tuple(f"Plural Form {i+1}" for i in range(num))
@@ -1,13 +1,40 @@
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
 
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.packaging.custom import StringProperty
 from openpyxl.workbook import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
 from . import __version__
 from .datastructures import Message, SpreadsheetContext
 from .styles import SpreadsheetStyles as S
+from .styles import Style
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+# The write buffer of the saved spreadsheet. The zip archive is written in many
+# small chunks, a larger buffer turns them into fewer writes.
+SAVE_BUFFER_SIZE = 1 << 20
+
+# A spreadsheet row, as (value, style) pairs of its cells.
+Row = tuple[tuple[Any, Style], ...]
+
+# Empty cells to shift the "Please fill out" hint to the translation column.
+PADDING = (("", S.NONE),) * 3
+
+# The static rows around the messages. They are the same for every spreadsheet,
+# so they are built once.
+FILL_OUT_ABOVE = (*PADDING, ("Please fill out the yellow fields ⤵️", S.FILL_HINT))
+FILL_OUT_BELOW = (*PADDING, ("Please fill out the yellow fields ⤴", S.FILL_HINT))
+
+HEADER = (
+    ("id", S.HEADER_LIGHT),
+    ("Context", S.HEADER),
+    ("Singular Form", S.HEADER),
+    ("Translation", S.HEADER),
+)
 
 
 class SpreadsheetGenerator:
@@ -19,7 +46,7 @@ class SpreadsheetGenerator:
     def get_tabledata(
         self,
         messages: list[Message],
-    ) -> list[Any]:
+    ) -> list[Row]:
         """
         Generate a Matrix array of messages for a table:
 
@@ -36,60 +63,76 @@ class SpreadsheetGenerator:
         #
         # id | singular | translation | space | plural |  plural translation * n
         # ^    ^          form idx 0    ^       ^         form idx 1+
-        fill_out_above = [
-            ("", None),
-            ("", None),
-            ("", None),
-            ("Please fill out the yellow fields ⤵️", S.FILL_HINT),
-        ]
-
-        fill_out_below = [
-            ("", None),
-            ("", None),
-            ("", None),
-            ("Please fill out the yellow fields ⤴", S.FILL_HINT),
-        ]
+        data: list[Row] = []
+        for i, m in enumerate(messages):
+            # Plural messages are not part of the table yet.
+            if m.is_plural:
+                continue
 
-        header = [
-            ("id", S.HEADER_LIGHT),
-            ("Context", S.HEADER),
-            ("Singular Form", S.HEADER),
-            ("Translation", S.HEADER),
-        ]
+            t = m.translation
+            obsolete = m.obsolete
 
-        data = []
-        for i, m in enumerate(messages):
             msg_str_style = S.MSG_STR
-            if m.obsolete:
+            if obsolete:
                 msg_str_style = S.MSG_STR_OBSOLETE
-            elif m.translation.msgstr == "":
+            elif t.msgstr == "":
                 msg_str_style = S.MSG_STR_EMPTY
 
-            if m.is_plural:
-                pass
-
-            else:
-                data.append(
-                    (
-                        (i + 1, S.ID),
-                        ("obsolete" if m.obsolete else m.context, S.CONTEXT),
-                        (m.translation.msgid, S.MSG_ID),
-                        (m.translation.msgstr, msg_str_style),
-                    ),
-                )
+            data.append(
+                (
+                    (i + 1, S.ID),
+                    ("obsolete" if obsolete else m.context, S.CONTEXT),
+                    (t.msgid, S.MSG_ID),
+                    (t.msgstr, msg_str_style),
+                ),
+            )
 
         return [
-            fill_out_above,
-            header,
+            FILL_OUT_ABOVE,
+            HEADER,
             *data,
-            fill_out_below,
+            FILL_OUT_BELOW,
         ]
 
-    def generate(self, filename: str, context: SpreadsheetContext) -> Path:
+    def iter_row_cells(
+        self,
+        ws: "WriteOnlyWorksheet",
+        row: Row,
+    ) -> Iterator[WriteOnlyCell]:
+        """
+        Turn a row of (value, style) tuples into styled cells, ready to be
+        streamed into the worksheet.
         """
-        Generates the
+        for value, style in row:
+            cell = WriteOnlyCell(ws, value=value)
+            style.apply(cell)
+            yield cell
+
+    def write_metadata(
+        self,
+        wm: "WriteOnlyWorksheet",
+        context: SpreadsheetContext,
+    ) -> None:
+        """
+        Write the metadata as key/value rows into the given sheet.
         """
-        wb = Workbook()
+        metadata = {
+            "Language": context.language,
+            "Created": context.created.isoformat(),
+            "PoxConvert": __version__,
+        }
+
+        for key, value in metadata.items():
+            wm.append((key, value))
+
+    def write(self, context: SpreadsheetContext, stream: IO[bytes]) -> None:
+        """
+        Write the spreadsheet of the given context into a binary stream.
+
+        The workbook is written in write-only mode, so rows are streamed to the
+        file instead of keeping a cell object of every message in memory.
+        """
+        wb = Workbook(write_only=True)
 
         # Attach the language as a custom property
         props = [
@@ -100,14 +143,11 @@ class SpreadsheetGenerator:
         for p in props:
             wb.custom_doc_props.append(p)
 
-        # Delete the auto generated "Sheet" worksheet
-        wb.remove_sheet(wb.worksheets[0])
-
         # Create two sheets, "Translations" to hold the actual translations
         # and "Metadata" to store some extra data not needed for translation,
         # but might be useful upon parsing.
-        ws: Worksheet = wb.create_sheet(f"Translations ({context.language})", index=0)
-        wm: Worksheet = wb.create_sheet("Metadata", index=1)
+        ws: "WriteOnlyWorksheet" = wb.create_sheet(f"Translations ({context.language})")
+        wm: "WriteOnlyWorksheet" = wb.create_sheet("Metadata")
 
         # Remove all gridlines right away
         ws.sheet_view.showGridLines = False
@@ -119,12 +159,26 @@ class SpreadsheetGenerator:
         )
 
         for row in data:
-            ws.append([i[0] for i in row])
+            ws.append(self.iter_row_cells(ws, row))
 
-        # Write out the Excel spreadsheet and return it's generated filename.
-        filename = self.outdir / filename.format(
+        self.write_metadata(wm, context)
+
+        wb.save(stream)
+
+    def get_filename(self, filename: str, context: SpreadsheetContext) -> Path:
+        """
+        Return the path of the spreadsheet for the given filename format.
+        """
+        return self.outdir / filename.format(
             lang=context.language,
             date=context.created.strftime("%Y-%m-%d"),
         )
-        wb.save(filename)
-        return filename
+
+    def generate(self, filename: str, context: SpreadsheetContext) -> Path:
+        """
+        Generates the spreadsheet in the output directory and returns its path.
+        """
+        path = self.get_filename(filename, context)
+        with path.open("wb", buffering=SAVE_BUFFER_SIZE) as f:
+            self.write(context, f)
+        return path
@@ -1,6 +1,7 @@
-from enum import Enum, auto
+from dataclasses import dataclass, field, fields
+from typing import Any
 
-from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.styles import Alignment, Border, Font, PatternFill
 from openpyxl.styles.fills import FILL_SOLID
 
 FONT_FAMILY = "Tahoma"
@@ -9,54 +10,96 @@ FONT_SIZE = 14
 WHITE = "FFFFFFFF"
 
 
-class SpreadsheetStyles(Enum):
+@dataclass(frozen=True, slots=True)
+class Style:
+    """
+    A cell style. The style objects are created once at import and shared by all
+    cells, so openpyxl registers each of them only once. Unset components keep
+    the cell's default.
+    """
+
+    font: Font | None = None
+    fill: PatternFill | None = None
+    alignment: Alignment | None = None
+    border: Border | None = None
+
+    # The (cell attribute, style object) pairs of the set components.
+    components: tuple[tuple[str, Any], ...] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "components",
+            tuple(
+                (f.name, getattr(self, f.name))
+                for f in fields(self)
+                if f.init and getattr(self, f.name) is not None
+            ),
+        )
+
+    def apply(self, cell: Any) -> None:
+        """
+        Apply the set components of this style to the given cell.
+        """
+        for attr, component in self.components:
+            setattr(cell, attr, component)
+
+
+class SpreadsheetStyles:
     """
     The openpyxl cell styles used in the spreadsheet.
     """
 
     # The overall headline
-    SHEET_HEADLINE = {
-        "fill": PatternFill(
+    SHEET_HEADLINE = Style(
+        fill=PatternFill(
             fill_type=FILL_SOLID,
             bgColor="CC0000",
         ),
-        "font": Font(
+        font=Font(
             name=FONT_FAMILY,
             size=22,
             bold=True,
             italic=False,
             color=WHITE,
         ),
-        "alignment": Alignment(
+        alignment=Alignment(
             horizontal="left",
             vertical="center",
             wrap_text=False,
             shrinkToFit=False,
         ),
-    }
+    )
+
+    # No style at all, the cell keeps openpyxl's defaults
+    NONE = Style()
 
-    ID = auto()
+    ID = Style()
 
     # The translation table header
-    HEADER = auto()
+    HEADER = Style()
 
     # Same, but slightly light
-    HEADER_LIGHT = auto()
+    HEADER_LIGHT = Style()
 
     # The "Please fill out" indicator
-    FILL_HINT = auto()
+    FILL_HINT = Style()
 
     # The context field
-    CONTEXT = auto()
+    CONTEXT = Style()
 
     # THe message id (original field)
-    MSG_ID = auto()
+    MSG_ID = Style()
 
     # A filled translation field
-    MSG_STR = auto()
+    MSG_STR = Style()
 
     # A to be filled translation field
-    MSG_STR_EMPTY = auto()
+    MSG_STR_EMPTY = Style()
 
     # An obsolete translation
-    MSG_STR_OBSOLETE = auto()
+    MSG_STR_OBSOLETE = Style()
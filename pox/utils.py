@@ -1,11 +1,34 @@
-import textwrap
+import os
+import re
+
+# Control characters and whitespace, as translation table and as search pattern.
+CONTROL_CHARACTERS = str.maketrans("", "", "\\\n\r\t ")
+RE_CONTROL_CHARACTERS = re.compile(r"[\\\n\r\t ]")
+
+# The line prefixes of box_message.
+BOX_SINGLE = "╼ "
+BOX_TOP = "┍ "
+BOX_MIDDLE = "│ "
+BOX_BOTTOM = "┕ "
 
 
 def dedent(text: str) -> str:
     """
     Dedents the given text and removes leading and trailing whitespace.
+
+    Like `textwrap.dedent`, but with plain string operations instead of regular
+    expressions. Blank lines don't count towards the common indentation.
     """
-    return textwrap.dedent(text).strip()
+    lines = text.split("\n")
+    indents = [
+        line[: len(line) - len(line.lstrip(" \t"))]
+        for line in lines
+        if line.strip(" \t")
+    ]
+    margin = len(os.path.commonprefix(indents)) if indents else 0
+    return "\n".join(
+        line[margin:] if line.strip(" \t") else "" for line in lines
+    ).strip()
 
 
 def box_message(text: str) -> str:
@@ -14,25 +37,30 @@ def box_message(text: str) -> str:
     │
     ╽ The last line is thicker.
     """
-    lines = text.splitlines(keepends=True)
+    lines = text.splitlines()
 
-    if len(lines) == 1:
-        return f"╼ {text}"
+    if len(lines) <= 1:
+        return BOX_SINGLE + text
 
-    return "".join(
-        (
-            f"┍ {lines[0]}",
-            *(f"│ {line}" for line in lines[1:-1]),
-            f"┕ {lines[-1]}",
-        ),
+    boxed = "\n".join(
+        [
+            BOX_TOP + lines[0],
+            *[BOX_MIDDLE + line for line in lines[1:-1]],
+            BOX_BOTTOM + lines[-1],
+        ],
     )
 
+    # Keep the trailing line break of the text.
+    if text.endswith("\n"):
+        boxed += "\n"
+    return boxed
+
 
 def remove_control_characters(s: str) -> str:
     """
     Remove control characters and whitespace from the string.
     """
-    replace = ["\\", "\n", "\r", "\t", " "]
-    for r in replace:
-        s = s.replace(r, "")
-    return s
+    # Most strings are clean already, return them as they are.
+    if not RE_CONTROL_CHARACTERS.search(s):
+        return s
+    return s.translate(CONTROL_CHARACTERS)
@@ -6,7 +6,9 @@ import enum
 from .utils import dedent
 
 
-class ConversionError(enum.Enum):
+class ConversionError(enum.StrEnum):
+    # Members are strings themselves, so they can be written and formatted
+    # directly, e.g. `E.FILE_UNREADABLE.format(p=path)`.
     LANGUAGE_WITH_GLOB = (
         'The "language" argument can only be used with a single po file.'
     )
@@ -14,9 +16,17 @@ class ConversionError(enum.Enum):
     FILE_IS_FOLDER = 'The po file "{p}" is a folder. Only set .po files.'
     OUTPUT_DIR_DOES_NOT_EXIST = 'The  output directory "{outdir}" does not exist '
     NO_LANGUAGE = 'The po file "{p}" has no "Language" set in it\'s metadata.'
+    DUPLICATE_OUTPUT = (
+        'The po files "{other}" and "{p}" would both be written to "{filename}". '
+        'Skipping "{p}".'
+    )
+    INVALID_FILENAME_FORMAT = (
+        'The filename format "{filename}" is invalid. Only the variables "{{lang}}" '
+        'and "{{date}}" can be used.'
+    )
 
 
-class ConversionErrorDescription(enum.Enum):
+class ConversionErrorDescription(enum.StrEnum):
     DECODE_ERROR = dedent(
         """
         The po file is unreadable.